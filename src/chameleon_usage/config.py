@@ -1,27 +1,42 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it.
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass(frozen=False)
+
+@dataclass(frozen=True, slots=True)
 class SiteConfig:
     key: str
     site_name: str
-    adapters: Optional[list[str]] = None
+    adapters: Optional[tuple[str, ...]] = None
     data_dir: Optional[str] = None
     db_uri: Optional[str] = None
 
 
 # TODO: kinda messy, use pydantic?
 def load_config(path: str | Path) -> dict[str, SiteConfig]:
-    data = yaml.safe_load(Path(path).read_text()) or {}
+    path = Path(path).resolve()
+    # Keyed on mtime so edits to the file are picked up. SiteConfig is frozen
+    # and holds no mutable values, so only the outer dict needs copying.
+    return dict(_load_config_cached(path, path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: Path, mtime_ns: int) -> dict[str, SiteConfig]:
+    data = yaml.load(path.read_bytes(), Loader=_YAMLLoader) or {}
     sites: dict[str, SiteConfig] = {}
-    for key, value in data.items():
-        payload = dict(value)
+    # Freshly parsed, so the entries can be edited in place.
+    for key, payload in data.items():
         if "data_dir" not in payload and "raw_parquet" in payload:
             payload["data_dir"] = payload.pop("raw_parquet")
+        if payload.get("adapters") is not None:
+            # Cached and shared between callers: keep it immutable.
+            payload["adapters"] = tuple(payload["adapters"])
         payload["key"] = key
         sites[key] = SiteConfig(**payload)
     return sites
@@ -1,4 +1,5 @@
 import logging
+import re
 
 import polars as pl
 
@@ -19,33 +20,28 @@ class RawTableRemoteError(RawTableLoadError):
     pass
 
 
-def classify_raw_table_load_error(table_path: str, exc: Exception) -> RawTableLoadError:
-    message = str(exc).lower()
+# Lowercase substrings of object-store error messages.
+_MISSING_MARKERS = ("not found", "no such file", "nosuchkey", "nosuchbucket", "404")
+_AUTH_MARKERS = (
+    "accessdenied",
+    "invalidaccesskeyid",
+    "signaturedoesnotmatch",
+    "latest/api/token",
+)
+# One alternation per category: a single scan of the message each.
+_MISSING_RE = re.compile("|".join(map(re.escape, _MISSING_MARKERS)))
+_AUTH_RE = re.compile("|".join(map(re.escape, _AUTH_MARKERS)))
+
 
+def classify_raw_table_load_error(table_path: str, exc: Exception) -> RawTableLoadError:
     if isinstance(exc, FileNotFoundError):
         return RawTableMissingError(f"Missing parquet: {table_path}")
 
     if isinstance(exc, (OSError, pl.exceptions.ComputeError)):
-        if any(
-            marker in message
-            for marker in (
-                "not found",
-                "no such file",
-                "nosuchkey",
-                "nosuchbucket",
-                "404",
-            )
-        ):
+        message = str(exc).lower()
+        if _MISSING_RE.search(message):
             return RawTableMissingError(f"Missing parquet: {table_path}")
-        if any(
-            marker in message
-            for marker in (
-                "accessdenied",
-                "invalidaccesskeyid",
-                "signaturedoesnotmatch",
-                "latest/api/token",
-            )
-        ):
+        if _AUTH_RE.search(message):
             return RawTableAuthError(f"Object-store auth error for {table_path}: {exc}")
         return RawTableRemoteError(f"Object-store error for {table_path}: {exc}")
 
@@ -4,7 +4,7 @@ from datetime import datetime
 
 import polars as pl
 
-from chameleon_usage.constants import ResourceTypes
+from chameleon_usage.constants import CollectorTypes, ResourceTypes
 from chameleon_usage.ingest.adapters import (
     Adapter,
     AdapterRegistry,
@@ -114,21 +114,14 @@ _occupied_resources = {
     ResourceTypes.DISK_GB: pl.col("root_gb"),
 }
 
-novaInstanceOccupiedReservation = Adapter(
+# One adapter for both booking types, so the instances source (joins, JSON
+# parsing, join_asof) is planned and run once.
+novaInstanceOccupied = Adapter(
     entity_col="uuid",
-    metric="occupied_reservation",
-    source=lambda t: nova_instances_source(t).filter(
-        pl.col("booking_type") == "reservation"
-    ),
-    context_cols=_occupied_context,
-    resource_cols=_occupied_resources,
-)
-novaInstanceOccupiedOndemand = Adapter(
-    entity_col="uuid",
-    metric="occupied_ondemand",
-    source=lambda t: nova_instances_source(t).filter(
-        pl.col("booking_type") == "ondemand"
-    ),
+    metric=pl.when(pl.col("booking_type") == "reservation")
+    .then(pl.lit("occupied_reservation"))
+    .otherwise(pl.lit("occupied_ondemand")),
+    source=nova_instances_source,
     context_cols=_occupied_context,
     resource_cols=_occupied_resources,
 )
@@ -174,14 +167,40 @@ REGISTRY = AdapterRegistry(
         novaHostTotal,
         blazarHostReservable,
         blazarAllocCommitted,
-        novaInstanceOccupiedReservation,
-        novaInstanceOccupiedOndemand,
+        novaInstanceOccupied,
         blazarDeviceReservable,
         blazarDeviceCommitted,
     ]
 )
 
 
+def _overlaps(start_cols: list[str], end_cols: list[str], time_range) -> pl.Expr:
+    """Rows that can still overlap the window, judged on raw bound columns.
+
+    A derived start is never earlier than any non-null start col (max) and a
+    derived end never later than any non-null end col (min), so a row failing
+    here would fail the interval overlap filter too.
+    """
+    range_start, range_end = time_range
+    starts = [pl.col(c).is_null() | (pl.col(c) <= range_end) for c in start_cols]
+    ends = [pl.col(c).is_null() | (pl.col(c) >= range_start) for c in end_cols]
+    return pl.all_horizontal(*starts, *ends)
+
+
+# Raw tables whose rows drive an interval, with the raw columns bounding it.
+# Lookup tables (hosts, reservations, ...) are left alone: join_asof needs
+# host records from before the window.
+_RAW_WINDOW_BOUNDS = {
+    # nova_instances_source: start = created_at,
+    # end = min(terminated_at, deleted_at, event_terminated_at)
+    Tables.NOVA_INSTANCES: (["created_at"], ["terminated_at", "deleted_at"]),
+    # blazar_*_allocations_source: effective_start = max(start_date, created_at),
+    # effective_end = min(end_date, deleted_at). A lease dropped here leaves
+    # its allocations with null dates, which the source already filters out.
+    Tables.BLAZAR_LEASES: (["start_date", "created_at"], ["end_date", "deleted_at"]),
+}
+
+
 def load_intervals(
     parquet_path: str,
     time_range: tuple[datetime, datetime] | None = None,
@@ -194,13 +213,25 @@ def load_intervals(
         time_range: Optional (start, end) to filter intervals that overlap this window
     """
     tables = load_raw_tables(parquet_path)
+    if time_range is not None:
+        # The overlap filter below only reaches scans of sources without
+        # joins; pre-filter the join inputs so the parquet reader can skip
+        # their out-of-window row groups too.
+        for key, (start_cols, end_cols) in _RAW_WINDOW_BOUNDS.items():
+            if key in tables:
+                tables[key] = tables[key].filter(
+                    _overlaps(start_cols, end_cols, time_range)
+                )
+
     intervals = REGISTRY.to_intervals(tables).with_columns(
-        pl.lit("current").alias("collector_type")
+        pl.lit(CollectorTypes.NEWCOLLECTOR).alias("collector_type")
     )
 
     if time_range is not None:
         range_start, range_end = time_range
-        # Inclusive: interval touches or overlaps window
+        # Inclusive: interval touches or overlaps window.
+        # Keep this lazy: Polars pushes it through the union into the parquet
+        # scans (see .explain()), so rows outside the window are never read.
         overlaps = (pl.col("start") <= range_end) & (
             pl.col("end").is_null() | (pl.col("end") >= range_start)
         )
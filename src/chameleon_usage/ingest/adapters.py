@@ -15,7 +15,9 @@ RawTables = dict[str, pl.LazyFrame]
 @dataclass
 class Adapter:
     entity_col: str
-    metric: str
+    # A literal metric name, or an expression over the source for adapters
+    # that split one source into several metrics.
+    metric: str | pl.Expr
     source: Callable[[RawTables], pl.LazyFrame]
     context_cols: dict[str, str] = field(default_factory=dict)
     resource_cols: dict[str, pl.Expr] = field(default_factory=dict)
@@ -30,11 +32,14 @@ class AdapterRegistry:
         self.adapters = adapters
 
     def _convert(self, df: pl.LazyFrame, adapter: Adapter) -> pl.LazyFrame:
+        metric = adapter.metric
+        if isinstance(metric, str):
+            metric = pl.lit(metric)
         return df.select(
             pl.col(adapter.entity_col).alias("entity_id"),
             pl.col(adapter.start_col).alias("start"),
             pl.col(adapter.end_col).alias("end"),
-            pl.lit(adapter.metric).alias(S.METRIC),
+            metric.alias(S.METRIC),
             *[pl.col(src).alias(dst) for src, dst in adapter.context_cols.items()],
             *[
                 expr.cast(pl.Float64).alias(resource_name)
@@ -45,15 +50,21 @@ class AdapterRegistry:
     def _inflate_resources(
         self,
         df: pl.LazyFrame,
-        resource_cols: dict[str, pl.Expr],
+        adapter: Adapter,
     ) -> pl.LazyFrame:
         """Explode each interval into N rows, one per resource type."""
-        all_cols = df.collect_schema().names()
-        resource_col_names = list(resource_cols.keys())
-        index_cols = [c for c in all_cols if c not in resource_col_names]
+        # Everything _convert selects except the resources; known up front,
+        # so no schema resolution of the source plan is needed.
+        index_cols = [
+            "entity_id",
+            "start",
+            "end",
+            S.METRIC,
+            *adapter.context_cols.values(),
+        ]
         return df.unpivot(
             index=index_cols,
-            on=resource_col_names,
+            on=list(adapter.resource_cols),
             variable_name=S.RESOURCE,
             value_name=S.VALUE,
         )
@@ -64,13 +75,16 @@ class AdapterRegistry:
             normalized = self._convert(adapter.source(tables), adapter)
             # HACK: handle case where no resource columns are specified, "unpivot" will explode.
             if adapter.resource_cols:
-                normalized = self._inflate_resources(normalized, adapter.resource_cols)
+                normalized = self._inflate_resources(normalized, adapter)
 
             # Validate core columns present - fails early, identifies which adapter broke
             IntervalModel.validate(normalized)
             intervals.append(normalized)
 
-        return pl.concat(intervals, how="diagonal").lazy()
+        # A single frame needs no column alignment; skip the concat node.
+        if len(intervals) == 1:
+            return intervals[0]
+        return pl.concat(intervals, how="diagonal")
 
 
 def _blazar_hosts(tables: RawTables) -> pl.LazyFrame:
@@ -116,6 +130,17 @@ def _blazar_lease_dates(tables: RawTables) -> pl.LazyFrame:
     )
 
 
+def _blazar_reservation_context(tables: RawTables) -> pl.LazyFrame:
+    """Reservation type and lease dates keyed by reservation_id.
+
+    Joined among the small dimension tables first, so the allocations go
+    through one join for all of it.
+    """
+    return _blazar_reservations(tables).join(
+        _blazar_lease_dates(tables), on="lease_id", how="left"
+    )
+
+
 def _effective_resources() -> list[pl.Expr]:
     """Pick flavor resources for flavor:instance, else host resources."""
     is_flavor = pl.col("reservation_type") == "flavor:instance"
@@ -137,16 +162,14 @@ def _effective_resources() -> list[pl.Expr]:
 
 def blazar_allocations_source(tables: RawTables) -> pl.LazyFrame:
     hosts = _blazar_hosts(tables)
-    reservations = _blazar_reservations(tables)
-    flavor_resources = _blazar_flavor_resources(tables)
-    lease_dates = _blazar_lease_dates(tables)
+    reservation_context = _blazar_reservation_context(tables).join(
+        _blazar_flavor_resources(tables), on="reservation_id", how="left"
+    )
 
     return (
         tables[Tables.BLAZAR_ALLOC]
         .join(hosts, on="compute_host_id", how="left")
-        .join(reservations, on="reservation_id", how="left")
-        .join(flavor_resources, on="reservation_id", how="left")
-        .join(lease_dates, on="lease_id", how="left")
+        .join(reservation_context, on="reservation_id", how="left")
         .with_columns(
             pl.max_horizontal("start_date", "lease_created_at").alias(
                 "effective_start"
@@ -171,14 +194,11 @@ def _blazar_devices(tables: RawTables) -> pl.LazyFrame:
 def blazar_device_allocations_source(tables: RawTables) -> pl.LazyFrame:
     """Load device allocations for chi@edge."""
     devices = _blazar_devices(tables)
-    reservations = _blazar_reservations(tables)
-    lease_dates = _blazar_lease_dates(tables)
 
     return (
         tables[Tables.BLAZAR_DEVICE_ALLOCATIONS]
         .join(devices, on="device_id", how="left")
-        .join(reservations, on="reservation_id", how="left")
-        .join(lease_dates, on="lease_id", how="left")
+        .join(_blazar_reservation_context(tables), on="reservation_id", how="left")
         .with_columns(
             pl.max_horizontal("start_date", "lease_created_at").alias(
                 "effective_start"
@@ -196,16 +216,28 @@ END_EVENTS = [
 ]
 RESUME_EVENTS = ["compute_unshelve_instance"]
 
-# Conditions for filtering events
+# Conditions for filtering events. _instance_events makes "event" categorical,
+# so these compare category ids rather than the strings.
 is_end_event = pl.col("event").is_in(END_EVENTS)
 is_resume_event = pl.col("event").is_in(RESUME_EVENTS)
-is_after_last_resume = pl.col("last_resume").is_null() | (
-    pl.col("start_time") > pl.col("last_resume")
-)
+# Applied to the raw (string) events in _instance_events.
+is_compute_event = pl.col("event").str.starts_with("compute_")
+# Inside a per-instance aggregation: latest resume, evaluated once per group
+last_resume = pl.col("start_time").filter(is_resume_event).max()
+is_after_last_resume = last_resume.is_null() | (pl.col("start_time") > last_resume)
 
 
 def _instance_events(tables: RawTables) -> pl.LazyFrame:
-    """Join actions → events, filter to successful."""
+    """Join actions → events, filter to successful compute_* events.
+
+    Only compute_* events have the actual hypervisor hostname in the host field.
+    Other events (conductor_*, api_*, etc.) have the controller hostname which
+    doesn't match any compute_nodes.hypervisor_hostname. END_EVENTS and
+    RESUME_EVENTS are compute_* too, so nothing downstream needs the others.
+
+    "event" has a handful of distinct values, so it is cast to categorical
+    once here for the event predicates above.
+    """
     return (
         tables[Tables.NOVA_ACTIONS]
         .join(
@@ -213,41 +245,30 @@ def _instance_events(tables: RawTables) -> pl.LazyFrame:
             left_on="id",
             right_on="action_id",
         )
-        .filter(pl.col("result").eq("Success"))
-        .select("instance_uuid", "host", "event", "start_time")
+        .filter(pl.col("result").eq("Success") & is_compute_event)
+        .select(
+            "instance_uuid",
+            "host",
+            pl.col("event").cast(pl.Categorical),
+            "start_time",
+        )
     )
 
 
-def _last_host(tables: RawTables) -> pl.LazyFrame:
-    """Most recent compute host per instance from events.
-
-    Only compute_* events have the actual hypervisor hostname in the host field.
-    Other events (conductor_*, api_*, etc.) have the controller hostname which
-    doesn't match any compute_nodes.hypervisor_hostname.
-    """
+def _last_host() -> pl.Expr:
+    """Most recent compute host, as a per-instance aggregation over events."""
     return (
-        _instance_events(tables)
-        .filter(pl.col("event").str.starts_with("compute_"))
-        .group_by("instance_uuid")
-        .agg(
-            pl.col("host")
-            .sort_by("start_time", descending=True)
-            .first()
-            .alias("last_host")
-        )
+        pl.col("host").sort_by("start_time", descending=True).first().alias("last_host")
     )
 
 
-def _terminated_at(tables: RawTables) -> pl.LazyFrame:
-    """First end event after last resume (or first end if no resume)."""
-    events = _instance_events(tables).with_columns(
-        pl.col("start_time")
-        .filter(is_resume_event)
-        .max()
-        .over("instance_uuid")
-        .alias("last_resume")
-    )
-    return events.group_by("instance_uuid").agg(
+def _terminated_at() -> pl.Expr:
+    """First end event after last resume (or first end if no resume).
+
+    A per-instance aggregation over events; last_resume is a group
+    aggregate, so no separate per-instance window is needed.
+    """
+    return (
         pl.col("start_time")
         .filter(is_end_event & is_after_last_resume)
         .min()
@@ -257,6 +278,11 @@ def _terminated_at(tables: RawTables) -> pl.LazyFrame:
     )
 
 
+def _event_recovery(events: pl.LazyFrame) -> pl.LazyFrame:
+    """Last host and event-derived termination per instance, in one group_by."""
+    return events.group_by("instance_uuid").agg(_last_host(), _terminated_at())
+
+
 def _nova_host_resources(tables: RawTables) -> pl.LazyFrame:
     return (
         tables[Tables.NOVA_HOSTS]
@@ -289,46 +315,63 @@ def _earliest_host_resources(tables: RawTables) -> pl.LazyFrame:
     )
 
 
-def nova_instances_source(tables: RawTables) -> pl.LazyFrame:
-    """Load instances with blazar reservation_id and recovered host from events.
+def _request_spec_reservations(tables: RawTables) -> pl.LazyFrame:
+    """Reservation ids named in each request spec, keyed by instance_uuid.
 
-    Uses launched_at as start (instances that never launched are filtered out).
-    End time is min(terminated_at, deleted_at, event_terminated_at) to handle
-    both KVM (accurate table values) and baremetal (needs event-derived).
+    json_path_match is null for a row it cannot parse, so one malformed spec
+    does not fail the whole site.
     """
-    instances = tables[Tables.NOVA_INSTANCES]
-
     # Extract reservation_id: scheduler_hints
     res_hint = (
         pl.col("spec")
         .str.json_path_match("$['nova_object.data'].scheduler_hints.reservation[0]")
         .alias("res_hint")
     )
-    # Extract reservation_id from flavor name (reservation:<uuid>)
+    # Extract reservation_id from flavor name (reservation:<uuid>). A literal
+    # prefix check; an empty remainder stays null, as with "^reservation:(.+)$".
+    flavor_name = pl.col("spec").str.json_path_match(
+        "$['nova_object.data'].flavor['nova_object.data'].name"
+    )
+    prefix = "reservation:"
     res_flavor = (
-        pl.col("spec")
-        .str.json_path_match("$['nova_object.data'].flavor['nova_object.data'].name")
-        .str.extract(r"^reservation:(.+)$", 1)
+        pl.when(
+            flavor_name.str.starts_with(prefix)
+            & (flavor_name.str.len_bytes() > len(prefix))
+        )
+        .then(flavor_name.str.slice(len(prefix)))
         .alias("res_flavor")
     )
-    request_specs = tables[Tables.NOVA_REQUEST_SPECS].select(
+    return tables[Tables.NOVA_REQUEST_SPECS].select(
         "instance_uuid", res_hint, res_flavor
     )
 
+
+def nova_instances_source(tables: RawTables) -> pl.LazyFrame:
+    """Load instances with blazar reservation_id and recovered host from events.
+
+    Uses launched_at as start (instances that never launched are filtered out).
+    End time is min(terminated_at, deleted_at, event_terminated_at) to handle
+    both KVM (accurate table values) and baremetal (needs event-derived).
+    """
+    instances = tables[Tables.NOVA_INSTANCES]
+
+    request_specs = _request_spec_reservations(tables)
+
     # Recover last known host and termination time from events
-    last_host = _last_host(tables)
-    event_terminated = _terminated_at(tables)
+    recovered = _event_recovery(_instance_events(tables))
     host_resources = _nova_host_resources(tables)
     earliest_hosts = _earliest_host_resources(tables)
 
+    # Shared by both columns below; evaluated once via CSE.
+    reservation_id = pl.coalesce("res_hint", "res_flavor")
+
     return (
         instances.filter(pl.col("launched_at").is_not_null())  # skip never-launched
         .join(request_specs, left_on="uuid", right_on="instance_uuid", how="left")
-        .join(last_host, left_on="uuid", right_on="instance_uuid", how="left")
-        .join(event_terminated, left_on="uuid", right_on="instance_uuid", how="left")
+        .join(recovered, left_on="uuid", right_on="instance_uuid", how="left")
         .with_columns(
-            pl.coalesce("res_hint", "res_flavor").alias("blazar_reservation_id"),
-            pl.when(pl.col("res_hint").is_null() & pl.col("res_flavor").is_null())
+            reservation_id.alias("blazar_reservation_id"),
+            pl.when(reservation_id.is_null())
             .then(pl.lit("ondemand"))
             .otherwise(pl.lit("reservation"))
             .alias("booking_type"),
@@ -352,12 +395,8 @@ def nova_instances_source(tables: RawTables) -> pl.LazyFrame:
         # Fallback: use earliest host record when join_asof fails (instance before first host record)
         .join(earliest_hosts, on="node", how="left")
         .with_columns(
-            pl.coalesce("hypervisor_type", "_fb_hypervisor_type").alias(
-                "hypervisor_type"
-            ),
-            pl.coalesce("host_vcpus", "_fb_host_vcpus").alias("host_vcpus"),
-            pl.coalesce("host_memory_mb", "_fb_host_memory_mb").alias("host_memory_mb"),
-            pl.coalesce("host_disk_gb", "_fb_host_disk_gb").alias("host_disk_gb"),
+            pl.col(c).fill_null(pl.col(f"_fb_{c}"))
+            for c in ("hypervisor_type", "host_vcpus", "host_memory_mb", "host_disk_gb")
         )
         .drop(
             "res_hint",
@@ -114,28 +114,27 @@ def apply_temporal_clamp(
         raise ValueError(f"Join keys missing: {missing}")
 
     # --- Setup ---
-    # Preserve original timestamps, add row ID for orphan detection
+    # Preserve original timestamps
     children = children.with_columns(
         pl.col("start").alias("original_start"),
         pl.col("end").alias("original_end"),
-    ).with_row_index("_child_id")
+    )
 
     needs_parent = require_parent if require_parent is not None else pl.lit(True)
     has_null_key = pl.any_horizontal(*[pl.col(k).is_null() for k in join_keys])
 
     # --- Branch 1: EXEMPT (don't need parent) ---
-    exempt = _tag(children.filter(~needs_parent), valid=True, action="none").drop(
-        "_child_id"
-    )
+    exempt = _tag(children.filter(~needs_parent), valid=True, action="none")
 
     # --- Branch 2: NULL_KEY (need parent but can't join) ---
     must_match = children.filter(needs_parent)
-    null_key = _tag(
-        must_match.filter(has_null_key), valid=False, action="null_key"
-    ).drop("_child_id")
+    null_key = _tag(must_match.filter(has_null_key), valid=False, action="null_key")
 
     # --- Branch 3+4: Join to find parents ---
-    matchable = must_match.filter(~has_null_key)
+    # Row ID for orphan detection. Added after the branch filters: nothing is
+    # pushed down past a row index, so adding it earlier would make every
+    # branch re-read the full children frame.
+    matchable = must_match.filter(~has_null_key).with_row_index("_child_id")
     parent_windows = parents.select(
         *join_keys,
         pl.col("start").alias("_p_start"),
@@ -180,7 +179,7 @@ def _add_audit_cols(df: pl.LazyFrame) -> pl.LazyFrame:
     )
 
 
-def clamp_hierarchy(intervals: pl.LazyFrame) -> pl.LazyFrame:
+def clamp_hierarchy(intervals: pl.LazyFrame, valid_only: bool = False) -> pl.LazyFrame:
     """
     Apply hierarchical temporal clamping: total → reservable → committed → occupied.
 
@@ -189,6 +188,9 @@ def clamp_hierarchy(intervals: pl.LazyFrame) -> pl.LazyFrame:
     - committed must fit within reservable (same blazar host)
     - occupied_reservation must fit within committed (same reservation + hypervisor)
     - occupied_ondemand skips clamping (no parent in the hierarchy)
+
+    valid_only=True keeps only valid rows and drops the valid column. The filter
+    applies to the output only; parents are still matched against every row.
     """
     total = intervals.filter(pl.col(S.METRIC).eq(M.TOTAL))
     reservable = intervals.filter(pl.col(S.METRIC).eq(M.RESERVABLE))
@@ -227,7 +229,7 @@ def clamp_hierarchy(intervals: pl.LazyFrame) -> pl.LazyFrame:
         join_keys=["blazar_reservation_id", "hypervisor_hostname", S.RESOURCE],
     )
 
-    return pl.concat(
+    result = pl.concat(
         [
             _add_audit_cols(total),
             clamped_reservable,
@@ -237,3 +239,6 @@ def clamp_hierarchy(intervals: pl.LazyFrame) -> pl.LazyFrame:
         ],
         how="diagonal",
     )
+    if valid_only:
+        result = result.filter(pl.col("valid")).drop("valid")
+    return result
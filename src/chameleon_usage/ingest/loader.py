@@ -1,6 +1,7 @@
 """Load raw data and convert to intervals."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import polars as pl
 
@@ -23,17 +24,31 @@ def _load_parquet(path: str, spec: SourceSpec, validate: bool = False):
     return df
 
 
+def _fetch_footer(parquet_path: str, spec: SourceSpec) -> pl.LazyFrame:
+    table = _load_parquet(path=parquet_path, spec=spec, validate=False)
+    table.collect_schema()  # forces the footer fetch, surfacing missing files
+    return table
+
+
 def load_raw_tables(parquet_path: str) -> dict[str, pl.LazyFrame]:
     """Load all interval sources for a site, validate, and concatenate.
 
-    Skips tables whose parquet files don't exist.
+    Skips tables whose parquet files don't exist. Footers are fetched
+    concurrently since each one is a round trip on object stores; pandera
+    validation stays on the calling thread since its config is process-global.
     """
+    with ThreadPoolExecutor(max_workers=len(SOURCE_REGISTRY)) as executor:
+        futures = {
+            key: executor.submit(_fetch_footer, parquet_path, spec)
+            for key, spec in SOURCE_REGISTRY.items()
+        }
+
     tables = {}
     missing: list[tuple[str, str]] = []
     for key, spec in SOURCE_REGISTRY.items():
         table_path = f"{parquet_path}/{spec.db_schema}.{spec.db_table}.parquet"
         try:
-            table = _load_parquet(path=parquet_path, spec=spec, validate=True)
+            table = spec.model.validate(futures[key].result())
             table.collect_schema()
             logger.debug("Loaded %s from %s", key, table_path)
         except Exception as exc:
@@ -6,12 +6,22 @@ Names necessary columns, minimal type coercion only.
 import pandera.polars as pa
 import polars as pl
 from pandera.api.polars.model_config import BaseConfig
+from pandera.config import get_config_context
+
+from chameleon_usage.schemas import coerce_to_schema
 
 
 class BaseRaw(pa.DataFrameModel):
     class Config(BaseConfig):
         strict = "filter"
 
+    @classmethod
+    def validate(cls, check_obj, *args, **kwargs):
+        """Validate, or with validation disabled only filter and coerce."""
+        if not get_config_context().validation_enabled:
+            return coerce_to_schema(check_obj, cls.to_schema())
+        return super().validate(check_obj, *args, **kwargs)
+
 
 class BlazarHostRaw(BaseRaw):
     id: str = pa.Field(unique=True)
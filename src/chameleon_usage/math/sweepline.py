@@ -32,18 +32,20 @@ def intervals_to_deltas(
     Args:
         value_col: Column with resource quantity. If None, counts intervals (+1/-1).
     """
-    delta_expr = pl.col(value_col) if value_col else pl.lit(1)
+    delta_expr = pl.col(value_col) if value_col else pl.lit(1, dtype=pl.Int32)
 
     starts = df.select(
         pl.col(start_col).alias(_TIME_COL),
-        *[pl.col(c) for c in group_cols],
+        pl.col(group_cols),
         delta_expr.alias(_DELTA_COL),
     )
     ends = df.filter(pl.col(end_col).is_not_null()).select(
         pl.col(end_col).alias(_TIME_COL),
-        *[pl.col(c) for c in group_cols],
+        pl.col(group_cols),
         (-delta_expr).alias(_DELTA_COL),
     )
+    # Two selects + concat beat a single-pass concat_list/explode or unpivot:
+    # the union is not copied and Polars shares the input scan between arms.
     return pl.concat([starts, ends])
 
 
@@ -11,6 +11,7 @@ USE run_pipeline() for the standard flow. Individual functions for custom pipeli
 
 import polars as pl
 
+from chameleon_usage.constants import CollectorTypes
 from chameleon_usage.constants import Metrics as M
 from chameleon_usage.constants import SchemaCols as S
 from chameleon_usage.math import sweepline, timeseries
@@ -26,6 +27,7 @@ def run_pipeline(
     intervals: pl.LazyFrame,
     spec: PipelineSpec,
     resample_interval: str | None = None,
+    metrics: list[str] | None = None,
 ) -> pl.LazyFrame:
     """Standard pipeline: intervals → aligned counts with derived metrics.
 
@@ -33,22 +35,38 @@ def run_pipeline(
         intervals: Raw interval data with [entity_id, start, end, *group_cols]
         spec: Pipeline config with group_cols and time_range
         resample_interval: Optional bucket size (e.g. "1d") for time-weighted resampling
+        metrics: Metrics present in intervals. If None, they are read with an
+            eager collect, which runs the intervals plan once more; callers
+            holding the intervals in memory can pass them instead.
 
     Returns:
-        Counts with derived metrics, optionally resampled.
+        Counts with derived metrics, optionally resampled. Apart from the
+        metric read, the plan is lazy, so prefer sink_parquet() or
+        collect(engine="streaming") to keep peak memory down on large inputs.
     """
     spec.validate_against(intervals)
 
+    # The derived stage needs the metric set up front to stay lazy.
+    if metrics is None:
+        metrics = (
+            intervals.select(pl.col(S.METRIC).unique()).collect()[S.METRIC].to_list()
+        )
+
     counts = intervals_to_counts(intervals, spec)
     counts = clip_to_window(counts, spec)
-    aligned = align_timestamps(counts, spec)
-    derived = compute_derived_metrics(aligned, spec)
 
     if resample_interval:
-        resampled = resample(derived, resample_interval, spec)
-        return resampled
+        # Sampling at bucket edges commutes with align's forward fill and with
+        # parent - child, so sample the (already sorted) counts and derive on
+        # the small bucketed frame instead of sorting the full aligned one.
+        resampled = resample(counts, resample_interval, spec)
+        derived = compute_derived_metrics(resampled, spec, metrics=metrics)
+        return derived.select(*spec.group_cols, S.TIMESTAMP, S.VALUE).sort(
+            [*spec.group_cols, S.TIMESTAMP]
+        )
 
-    return derived
+    aligned = align_timestamps(counts, spec)
+    return compute_derived_metrics(aligned, spec, metrics=metrics)
 
 
 # =============================================================================
@@ -93,10 +111,10 @@ def resample(df: pl.LazyFrame, interval: str, spec: PipelineSpec) -> pl.LazyFram
     """
     spec.validate_against(df)
     df = TimelineModel.validate(df)
-    result = timeseries.resample_step_function(
+    # resample_step_function already zero-fills buckets before the first event
+    return timeseries.resample_step_function(
         df, "timestamp", "value", interval, list(spec.group_cols), spec.time_range
     )
-    return result.with_columns(pl.col("value").fill_null(0))
 
 
 def collapse_dimension(
@@ -132,34 +150,56 @@ DERIVED_METRICS = [
 ]
 
 
-def compute_derived_metrics(df: pl.LazyFrame, spec: PipelineSpec) -> pl.LazyFrame:
-    """Derive metrics from utilization tree: result = parent - child."""
+def compute_derived_metrics(
+    df: pl.LazyFrame, spec: PipelineSpec, metrics: list[str] | None = None
+) -> pl.LazyFrame:
+    """Derive metrics from utilization tree: result = parent - child.
+
+    Args:
+        df: Aligned counts
+        spec: Pipeline config with group_cols
+        metrics: Metric values that may occur in df. If None they are read
+            from df, which executes its plan once more.
+    """
     df = TimelineModel.validate(df)
+    if metrics is None:
+        metrics = df.select(pl.col(S.METRIC).unique()).collect()[S.METRIC].to_list()
 
-    # Pivot metrics to columns
+    # Pivot metrics to columns with a lazy group_by. A metric missing from a
+    # group is 0, like pivot().fill_null(0); a metric missing from the whole
+    # frame stays null, so its rows (and anything derived from it) drop out.
     index_cols = ["timestamp", *[c for c in spec.group_cols if c != "metric"]]
-    pivoted = (
-        df.collect().pivot(on="metric", index=index_cols, values="value").fill_null(0)
+    # maintain_order keeps the output order stable between runs.
+    pivoted = df.group_by(index_cols, maintain_order=True).agg(
+        pl.col(S.VALUE).filter(pl.col(S.METRIC) == m).first().alias(m) for m in metrics
+    )
+    pivoted = pivoted.with_columns(
+        pl.when(pl.col(m).is_not_null().any()).then(pl.col(m).fill_null(0))
+        for m in metrics
     )
 
-    # Apply tree derivations
+    # Apply tree derivations. Base metrics in sorted order, as pivot() gave
+    # them for the (metric-sorted) aligned counts.
+    cols = sorted(metrics)
     for result, parent, child in DERIVED_METRICS:
-        cols = pivoted.columns
         if parent in cols and child in cols:
             pivoted = pivoted.with_columns(
                 (pl.col(parent) - pl.col(child)).alias(result)
             )
+            if result not in cols:
+                cols.append(result)
 
-    result = (
-        pivoted.unpivot(index=index_cols, variable_name="metric", value_name="value")
-        .drop_nulls(S.VALUE)
-        .lazy()
-    )
+    result = pivoted.unpivot(
+        on=cols, index=index_cols, variable_name="metric", value_name="value"
+    ).drop_nulls(S.VALUE)
     return TimelineModel.validate(result)
 
 
 def add_site_context(
-    df: pl.LazyFrame, spec: PipelineSpec, site: str, collector_type: str = "current"
+    df: pl.LazyFrame,
+    spec: PipelineSpec,
+    site: str,
+    collector_type: str = CollectorTypes.NEWCOLLECTOR,
 ) -> pl.LazyFrame:
     """Add site and collector_type columns."""
     df = TimelineModel.validate(df)
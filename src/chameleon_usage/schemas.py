@@ -7,9 +7,10 @@ from typing import ClassVar
 import pandera.polars as pa
 import polars as pl
 from pandera.api.polars.model_config import BaseConfig
+from pandera.config import get_config_context
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineSpec:
     """Pipeline configuration: grouping and time window.
 
@@ -27,6 +28,25 @@ class PipelineSpec:
             raise ValueError(f"group_cols not in data: {missing}")
 
 
+def coerce_to_schema(check_obj, schema: pa.DataFrameSchema):
+    """Apply a schema's column filtering and dtype coercion, without checks.
+
+    pandera skips coercion along with the checks when validation is disabled,
+    so models call this instead to keep the same columns and dtypes.
+    """
+    names = check_obj.collect_schema().names()
+    if schema.strict == "filter":
+        names = [c for c in names if c in schema.columns]
+    exprs = []
+    for name in names:
+        column = schema.columns.get(name)
+        if column is not None and (column.coerce or schema.coerce):
+            exprs.append(pl.col(name).cast(column.dtype.type))
+        else:
+            exprs.append(pl.col(name))
+    return check_obj.select(exprs)
+
+
 class _OrderedModel(pa.DataFrameModel):
     """Base model that coerces column order to match schema.
 
@@ -52,6 +72,8 @@ class _OrderedModel(pa.DataFrameModel):
         all_cols = check_obj.collect_schema().names()
         extra_cols = [c for c in all_cols if c not in schema_cols]
         check_obj = check_obj.select(*schema_cols, *extra_cols)
+        if not get_config_context().validation_enabled:
+            return coerce_to_schema(check_obj, cls.to_schema())
         return super().validate(check_obj, *args, **kwargs)
 
 
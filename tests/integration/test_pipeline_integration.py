@@ -8,7 +8,14 @@ from chameleon_usage.constants import Metrics as M
 from chameleon_usage.constants import ResourceTypes as RT
 from chameleon_usage.ingest.adapters import Adapter, AdapterRegistry
 from chameleon_usage.ingest.coerce import clamp_hierarchy
-from chameleon_usage.pipeline import run_pipeline
+from chameleon_usage.pipeline import (
+    align_timestamps,
+    clip_to_window,
+    compute_derived_metrics,
+    intervals_to_counts,
+    resample,
+    run_pipeline,
+)
 from chameleon_usage.schemas import IntervalModel, PipelineSpec
 
 
@@ -62,6 +69,33 @@ def test_clamp_hierarchy_to_pipeline():
     assert len(result) > 0
 
 
+def test_clamp_hierarchy_valid_only_matches_filter():
+    """valid_only=True equals filtering on valid afterwards, minus the column."""
+    intervals = pl.LazyFrame(
+        {
+            "entity_id": ["host1", "blazar1", "blazar2", "inst1"],
+            "start": [datetime(2024, 1, 1)] * 4,
+            "end": [datetime(2024, 1, 5)] * 4,
+            "metric": [M.TOTAL, M.RESERVABLE, M.RESERVABLE, M.OCCUPIED_RESERVATION],
+            "resource": [RT.NODE] * 4,
+            "value": [1.0] * 4,
+            "hypervisor_hostname": ["host1", "host1", "host2", "host1"],
+            "blazar_host_id": [None, "blazar1", "blazar2", None],
+            "blazar_reservation_id": [None, None, None, "res1"],
+            "reservation_type": [None] * 4,
+        }
+    )
+
+    expected = (
+        clamp_hierarchy(intervals).filter(pl.col("valid")).drop("valid").collect()
+    )
+    result = clamp_hierarchy(intervals, valid_only=True).collect()
+
+    assert "valid" not in result.columns
+    assert result.sort("entity_id").equals(expected.sort("entity_id"))
+    assert "blazar2" not in result["entity_id"].to_list()  # orphan reservable
+
+
 def test_run_pipeline_produces_derived_metrics():
     spec = PipelineSpec(
         group_cols=("metric", "resource"),
@@ -80,3 +114,50 @@ def test_run_pipeline_produces_derived_metrics():
     result = run_pipeline(df, spec).collect()
 
     assert M.AVAILABLE_RESERVABLE in result["metric"].to_list()
+    # Callers holding the intervals can pass the metric set instead.
+    given = run_pipeline(df, spec, metrics=[M.RESERVABLE, M.COMMITTED]).collect()
+    assert given.equals(result)
+
+
+def test_run_pipeline_resample_matches_resampling_derived():
+    """Resampling counts then deriving equals deriving then resampling."""
+    spec = PipelineSpec(
+        group_cols=("metric", "resource"),
+        time_range=(datetime(2024, 1, 1), datetime(2024, 1, 8)),
+    )
+    df = pl.LazyFrame(
+        {
+            "entity_id": ["t", "r", "c", "o", "d"],
+            "start": [
+                datetime(2023, 12, 30),
+                datetime(2024, 1, 1, 6),
+                datetime(2024, 1, 2, 12),
+                datetime(2024, 1, 3),
+                datetime(2024, 1, 2),
+            ],
+            "end": [
+                None,
+                datetime(2024, 1, 6),
+                datetime(2024, 1, 4, 18),
+                datetime(2024, 1, 4),
+                datetime(2024, 1, 9),
+            ],
+            "metric": [
+                M.TOTAL,
+                M.RESERVABLE,
+                M.COMMITTED,
+                M.OCCUPIED_RESERVATION,
+                M.OCCUPIED_ONDEMAND,
+            ],
+            "resource": ["vcpu", "vcpu", "vcpu", "vcpu", "vcpu"],
+            "value": [8.0, 4.0, 2.0, 1.0, 3.0],
+        }
+    )
+    counts = clip_to_window(intervals_to_counts(df, spec), spec)
+    derived = compute_derived_metrics(align_timestamps(counts, spec), spec)
+    expected = resample(derived, "1d", spec).collect()
+
+    result = run_pipeline(df, spec, resample_interval="1d").collect()
+
+    assert result.columns == expected.columns
+    assert result.equals(expected)
@@ -0,0 +1,118 @@
+"""Tests for adapters and their source helpers.
+
+_terminated_at picks, per instance, the first successful end event after the
+last resume event (or the first end event if the instance never resumed).
+"""
+
+from datetime import datetime
+
+import polars as pl
+
+from chameleon_usage.ingest.adapters import (
+    Adapter,
+    AdapterRegistry,
+    _event_recovery,
+    _instance_events,
+    _request_spec_reservations,
+)
+from chameleon_usage.sources import Tables
+
+
+def _tables(events: list[tuple[str, str, datetime, str]]) -> dict[str, pl.LazyFrame]:
+    uuids, names, times, results = zip(*events)
+    n = len(events)
+    return {
+        Tables.NOVA_ACTIONS: pl.LazyFrame(
+            {"id": list(range(n)), "instance_uuid": list(uuids)}
+        ),
+        Tables.NOVA_ACTION_EVENTS: pl.LazyFrame(
+            {
+                "action_id": list(range(n)),
+                "host": ["compute-1"] * n,
+                "event": list(names),
+                "start_time": list(times),
+                "result": list(results),
+            }
+        ),
+    }
+
+
+def test_terminated_at_uses_first_end_after_last_resume():
+    tables = _tables(
+        [
+            ("a", "compute_shelve_instance", datetime(2024, 1, 1), "Success"),
+            ("a", "compute_unshelve_instance", datetime(2024, 1, 2), "Success"),
+            ("a", "compute_reboot_instance", datetime(2024, 1, 3), "Success"),
+            ("a", "compute_terminate_instance", datetime(2024, 1, 5), "Success"),
+            ("a", "compute_terminate_instance", datetime(2024, 1, 4), "Error"),
+            ("b", "compute_terminate_instance", datetime(2024, 2, 1), "Success"),
+            ("c", "compute_unshelve_instance", datetime(2024, 3, 1), "Success"),
+        ]
+    )
+    result = _event_recovery(_instance_events(tables)).collect()
+    by_uuid = dict(zip(result["instance_uuid"], result["event_terminated_at"]))
+
+    assert by_uuid["a"] == datetime(2024, 1, 5)
+    assert by_uuid["b"] == datetime(2024, 2, 1)
+    assert by_uuid["c"] is None
+
+
+def test_registry_metric_expression_splits_one_source():
+    source = pl.LazyFrame(
+        {
+            "id": ["x", "y", "z"],
+            "kind": ["a", "b", "a"],
+            "created_at": [datetime(2024, 1, d) for d in (1, 2, 3)],
+            "deleted_at": [None, datetime(2024, 2, 1), None],
+        }
+    )
+    registry = AdapterRegistry(
+        [
+            Adapter(
+                "id",
+                pl.when(pl.col("kind") == "a")
+                .then(pl.lit("metric_a"))
+                .otherwise(pl.lit("metric_b")),
+                lambda tables: source,
+                resource_cols={"node": pl.lit(1)},
+            )
+        ]
+    )
+    result = registry.to_intervals({}).collect()
+
+    rows = result.sort("entity_id").select("entity_id", "start", "end", "metric")
+    assert rows.rows() == [
+        ("x", datetime(2024, 1, 1), None, "metric_a"),
+        ("y", datetime(2024, 1, 2), datetime(2024, 2, 1), "metric_b"),
+        ("z", datetime(2024, 1, 3), None, "metric_a"),
+    ]
+
+
+def test_request_spec_reservations_tolerates_bad_specs():
+    hinted = '{"nova_object.data": {"scheduler_hints": {"reservation": ["r1"]}}}'
+    flavored = (
+        '{"nova_object.data": {"flavor": {"nova_object.data":'
+        ' {"name": "reservation:r2"}}}}'
+    )
+    bare_hint = '{"nova_object.data": {"scheduler_hints": {"reservation": "r3"}}}'
+    specs = {
+        "hint": hinted,
+        "flavor": flavored,
+        "bare_hint": bare_hint,
+        "empty": "",
+        "garbage": "not json",
+        "truncated": hinted[:20],
+        "null": None,
+    }
+    tables = {
+        Tables.NOVA_REQUEST_SPECS: pl.LazyFrame(
+            {"instance_uuid": list(specs), "spec": list(specs.values())}
+        )
+    }
+    result = _request_spec_reservations(tables).collect()
+    rows = {r[0]: r[1:] for r in result.rows()}
+
+    assert rows["hint"] == ("r1", None)
+    assert rows["flavor"] == (None, "r2")
+    for bad in ("bare_hint", "empty", "garbage", "truncated", "null"):
+        assert rows[bad] == (None, None)
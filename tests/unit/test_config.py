@@ -0,0 +1,23 @@
+"""Tests for chameleon_usage.config"""
+
+from chameleon_usage.config import load_config
+
+SITE_YML = """
+chi_tacc:
+  site_name: CHI@TACC
+  adapters: [nova, blazar]
+  raw_parquet: /data/tacc
+"""
+
+
+def test_load_config_results_are_not_shared(tmp_path):
+    """Cached configs can't be changed through one caller's result."""
+    path = tmp_path / "site.yml"
+    path.write_text(SITE_YML)
+
+    first = load_config(path)
+    first.pop("chi_tacc")
+    second = load_config(path)
+
+    assert second["chi_tacc"].adapters == ("nova", "blazar")
+    assert second["chi_tacc"].data_dir == "/data/tacc"
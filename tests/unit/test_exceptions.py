@@ -0,0 +1,43 @@
+"""Tests for chameleon_usage.exceptions
+
+classify_raw_table_load_error maps a raw-table load failure to:
+  - RawTableMissingError : file/object does not exist
+  - RawTableAuthError    : object-store credentials rejected
+  - RawTableRemoteError  : any other object-store/network error
+  - RawTableLoadError    : everything else
+"""
+
+import polars as pl
+import pytest
+
+from chameleon_usage.exceptions import (
+    RawTableAuthError,
+    RawTableLoadError,
+    RawTableMissingError,
+    RawTableRemoteError,
+    classify_raw_table_load_error,
+)
+
+PATH = "s3://bucket/nova.instances.parquet"
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (FileNotFoundError("gone"), RawTableMissingError),
+        (OSError("NoSuchKey: The specified key does not exist"), RawTableMissingError),
+        (pl.exceptions.ComputeError("HTTP status 404"), RawTableMissingError),
+        (OSError("AccessDenied: Access Denied"), RawTableAuthError),
+        (
+            pl.exceptions.ComputeError("fetching latest/api/token timed out"),
+            RawTableAuthError,
+        ),
+        (OSError("connection reset by peer"), RawTableRemoteError),
+        (ValueError("bad schema"), RawTableLoadError),
+    ],
+)
+def test_classify_raw_table_load_error(exc, expected):
+    result = classify_raw_table_load_error(PATH, exc)
+
+    assert type(result) is expected
+    assert PATH in str(result)
@@ -153,3 +153,51 @@ def test_derived_metrics_preserves_extra_group_cols():
     )
     assert vcpu_avail["value"][0] == 7.0
     assert mem_avail["value"][0] == 60.0
+
+
+def test_derived_metrics_zero_fills_missing_group_metric():
+    """A metric absent from one group counts as 0 there, unknown ones drop out."""
+    spec = PipelineSpec(group_cols=("metric", "resource"), time_range=TIME_RANGE)
+    df = pl.LazyFrame(
+        {
+            "timestamp": [datetime(2024, 1, 1)] * 3,
+            "metric": [M.RESERVABLE, M.COMMITTED, M.RESERVABLE],
+            "resource": ["vcpu", "vcpu", "memory"],
+            "value": [10.0, 3.0, 100.0],
+        }
+    )
+    result = compute_derived_metrics(
+        df, spec, metrics=[M.RESERVABLE, M.COMMITTED, M.TOTAL]
+    ).collect()
+
+    mem_committed = result.filter(
+        (pl.col("metric") == M.COMMITTED) & (pl.col("resource") == "memory")
+    )
+    mem_avail = result.filter(
+        (pl.col("metric") == M.AVAILABLE_RESERVABLE) & (pl.col("resource") == "memory")
+    )
+    assert mem_committed["value"].to_list() == [0.0]
+    assert mem_avail["value"].to_list() == [100.0]
+    assert M.TOTAL not in result["metric"].to_list()
+    assert M.ONDEMAND_CAPACITY not in result["metric"].to_list()
+
+
+def test_derived_metrics_row_order_is_stable():
+    """Rows come out metric by metric, groups in first-seen order, every run."""
+    spec = PipelineSpec(group_cols=("metric", "resource"), time_range=TIME_RANGE)
+    df = pl.LazyFrame(
+        {
+            "timestamp": [datetime(2024, 1, d) for d in (1, 2, 3)] * 2,
+            "metric": [M.COMMITTED] * 3 + [M.RESERVABLE] * 3,
+            "resource": ["vcpu"] * 6,
+            "value": [1.0, 2.0, 3.0, 10.0, 10.0, 10.0],
+        }
+    )
+    runs = [compute_derived_metrics(df, spec).collect() for _ in range(5)]
+
+    assert runs[0].select("metric", "timestamp").rows() == [
+        (m, datetime(2024, 1, d))
+        for m in (M.COMMITTED, M.RESERVABLE, M.AVAILABLE_RESERVABLE)
+        for d in (1, 2, 3)
+    ]
+    assert all(run.equals(runs[0]) for run in runs)
@@ -4,8 +4,10 @@ from datetime import datetime
 
 import polars as pl
 import pytest
+from pandera.config import config_context
 from pandera.errors import SchemaError
 
+from chameleon_usage.ingest.rawschemas import NovaServiceRaw
 from chameleon_usage.schemas import _OrderedModel, PipelineSpec
 
 
@@ -32,6 +34,26 @@ def test_ordered_model_enforces_schema():
         _TestModel.validate(df)
 
 
+def test_skipped_validation_still_coerces_and_filters():
+    """With validation off, raw models keep the same columns and dtypes."""
+    df = pl.LazyFrame(
+        {
+            "extra": ["dropped"],
+            "id": pl.Series([1], dtype=pl.Int32),
+            "created_at": pl.Series([datetime(2024, 1, 1)], dtype=pl.Datetime("ns")),
+            "deleted_at": [None],
+            "host": ["h1"],
+            "binary": ["nova-compute"],
+        }
+    )
+    validated = NovaServiceRaw.validate(df).collect_schema()
+
+    with config_context(validation_enabled=False):
+        skipped = NovaServiceRaw.validate(df).collect_schema()
+
+    assert skipped == validated
+
+
 def test_pipeline_spec_validate_against_missing_cols():
     """Raises when group_cols missing from data."""
     spec = PipelineSpec(